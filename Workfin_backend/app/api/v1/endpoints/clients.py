@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import case, exists, literal, select, update
+from sqlalchemy.orm import joinedload, selectinload
 from app.schemas.client import (
     ClientCreate,
     ClientUpdate,
@@ -38,27 +38,32 @@ DEFAULT_ADJUSTMENT_TYPES = [
     'Training and Other'
 ]
 
+# Relationships loaded for a full ClientResponse, built once and shared by every detail query.
+# The one-to-one address is joined into the client SELECT; collections stay as selectin loads.
+CLIENT_DETAIL_LOAD_OPTIONS = (
+    joinedload(Client.address),
+    selectinload(Client.users),
+    selectinload(Client.adjustment_types),
+    selectinload(Client.pms_integrations),
+    selectinload(Client.denpay_periods),
+    selectinload(Client.fy_end_periods)
+)
+
+# ClientUpdate fields copied straight onto the Client row (status changes go through delete_client)
+CLIENT_UPDATABLE_FIELDS = frozenset(ClientUpdate.model_fields) - {"status"}
+
+# Only the columns ClientListItem exposes, selected as plain rows rather than full ORM objects
+CLIENT_LIST_COLUMNS = tuple(getattr(Client, field) for field in ClientListItem.model_fields)
+
 
 @router.get("/", response_model=List[ClientListItem])
 async def get_clients(db: AsyncSession = Depends(get_db)):
     """Get all clients from database"""
     try:
-        result = await db.execute(select(Client))
-        clients = result.scalars().all()
+        result = await db.execute(select(*CLIENT_LIST_COLUMNS))
 
-        return [
-            ClientListItem(
-                id=client.id,
-                legal_trading_name=client.legal_trading_name,
-                workfin_reference=client.workfin_reference,
-                status=client.status,
-                contact_email=client.contact_email,
-                contact_phone=client.contact_phone,
-                client_type=client.client_type,
-                created_at=client.created_at
-            )
-            for client in clients
-        ]
+        # Validated as a batch against List[ClientListItem] by the response model
+        return result.mappings().all()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -67,21 +72,14 @@ async def get_clients(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{client_id}", response_model=ClientResponse)
-async def get_client(client_id: str, db: AsyncSession = Depends(get_db)):
+async def get_client(client_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get a specific client by ID with all related data"""
     try:
         # Load client with all relationships
         result = await db.execute(
             select(Client)
-            .options(
-                selectinload(Client.address),
-                selectinload(Client.users),
-                selectinload(Client.adjustment_types),
-                selectinload(Client.pms_integrations),
-                selectinload(Client.denpay_periods),
-                selectinload(Client.fy_end_periods)
-            )
-            .where(Client.id == uuid.UUID(client_id))
+            .options(*CLIENT_DETAIL_LOAD_OPTIONS)
+            .where(Client.id == client_id)
         )
         client = result.scalar_one_or_none()
 
@@ -91,12 +89,7 @@ async def get_client(client_id: str, db: AsyncSession = Depends(get_db)):
                 detail="Client not found"
             )
 
-        return ClientResponse.from_orm(client)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid client ID format"
-        )
+        return client
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -109,7 +102,10 @@ async def create_client(client: ClientCreate, db: AsyncSession = Depends(get_db)
     """Create a new client with all related data (onboarding form submission)"""
     try:
         # Step 1: Create the client
+        # IDs are assigned client-side so every insert below goes out in the single commit flush
         new_client = Client(
+            id=uuid.uuid4(),
+
             # Basic info
             legal_trading_name=client.legal_trading_name,
             workfin_reference=client.workfin_reference,
@@ -154,7 +150,6 @@ async def create_client(client: ClientCreate, db: AsyncSession = Depends(get_db)
             feature_powerbi_enabled=client.feature_powerbi_enabled
         )
         db.add(new_client)
-        await db.flush()  # Flush to get the client ID
 
         # Step 2: Create client address
         client_address = ClientAddress(
@@ -170,12 +165,12 @@ async def create_client(client: ClientCreate, db: AsyncSession = Depends(get_db)
 
         # Step 3: Create admin user
         admin_user = User(
+            id=uuid.uuid4(),
             email=client.admin_user.email,
             name=client.admin_user.name,
             client_id=new_client.id
         )
         db.add(admin_user)
-        await db.flush()  # Flush to get user ID
 
         # Step 4: Assign ClientAdmin role to the admin user
         admin_role = UserRoleAssignment(
@@ -185,66 +180,60 @@ async def create_client(client: ClientCreate, db: AsyncSession = Depends(get_db)
         db.add(admin_role)
 
         # Step 5: Create adjustment types (use provided or defaults)
-        adjustment_types_to_create = client.adjustment_types if client.adjustment_types else [
-            {"name": name} for name in DEFAULT_ADJUSTMENT_TYPES
-        ]
-        for adj_type_data in adjustment_types_to_create:
-            adj_type = ClientAdjustmentType(
-                client_id=new_client.id,
-                name=adj_type_data.name if hasattr(adj_type_data, 'name') else adj_type_data['name']
-            )
-            db.add(adj_type)
+        adjustment_type_names = (
+            [adj_type.name for adj_type in client.adjustment_types]
+            if client.adjustment_types else DEFAULT_ADJUSTMENT_TYPES
+        )
+        db.add_all([
+            ClientAdjustmentType(client_id=new_client.id, name=name)
+            for name in adjustment_type_names
+        ])
 
         # Step 6: Create PMS integrations (if any)
-        for pms_data in client.pms_integrations or []:
-            pms_integration = ClientPMSIntegration(
+        db.add_all([
+            ClientPMSIntegration(
                 client_id=new_client.id,
                 pms_type=pms_data.pms_type,
                 integration_config=pms_data.integration_config,
                 status=pms_data.status or "Active"
             )
-            db.add(pms_integration)
+            for pms_data in client.pms_integrations or []
+        ])
 
         # Step 7: Create Denpay periods (if any)
-        for period_data in client.denpay_periods or []:
-            denpay_period = ClientDenpayPeriod(
+        db.add_all([
+            ClientDenpayPeriod(
                 client_id=new_client.id,
                 month=period_data.month,
                 from_date=period_data.from_date,
                 to_date=period_data.to_date
             )
-            db.add(denpay_period)
+            for period_data in client.denpay_periods or []
+        ])
 
         # Step 8: Create FY End periods (if any)
-        for period_data in client.fy_end_periods or []:
-            fy_end_period = ClientFYEndPeriod(
+        db.add_all([
+            ClientFYEndPeriod(
                 client_id=new_client.id,
                 month=period_data.month,
                 from_date=period_data.from_date,
                 to_date=period_data.to_date
             )
-            db.add(fy_end_period)
+            for period_data in client.fy_end_periods or []
+        ])
 
         # Commit all changes
         await db.commit()
 
-        # Reload with all relationships
-        await db.refresh(new_client)
+        # Reload with all relationships (unloaded columns such as created_at are filled in by this query too)
         result = await db.execute(
             select(Client)
-            .options(
-                selectinload(Client.address),
-                selectinload(Client.users),
-                selectinload(Client.adjustment_types),
-                selectinload(Client.pms_integrations),
-                selectinload(Client.denpay_periods),
-                selectinload(Client.fy_end_periods)
-            )
+            .options(*CLIENT_DETAIL_LOAD_OPTIONS)
             .where(Client.id == new_client.id)
         )
         client_with_relations = result.scalar_one()
 
-        return ClientResponse.from_orm(client_with_relations)
+        return client_with_relations
 
     except Exception as e:
         await db.rollback()
@@ -255,21 +244,14 @@ async def create_client(client: ClientCreate, db: AsyncSession = Depends(get_db)
 
 
 @router.put("/{client_id}", response_model=ClientResponse)
-async def update_client(client_id: str, client: ClientUpdate, db: AsyncSession = Depends(get_db)):
+async def update_client(client_id: uuid.UUID, client: ClientUpdate, db: AsyncSession = Depends(get_db)):
     """Update an existing client"""
     try:
         # Load client with all relationships
         result = await db.execute(
             select(Client)
-            .options(
-                selectinload(Client.address),
-                selectinload(Client.users),
-                selectinload(Client.adjustment_types),
-                selectinload(Client.pms_integrations),
-                selectinload(Client.denpay_periods),
-                selectinload(Client.fy_end_periods)
-            )
-            .where(Client.id == uuid.UUID(client_id))
+            .options(*CLIENT_DETAIL_LOAD_OPTIONS)
+            .where(Client.id == client_id)
         )
         existing_client = result.scalar_one_or_none()
 
@@ -283,76 +265,19 @@ async def update_client(client_id: str, client: ClientUpdate, db: AsyncSession =
         update_data = client.dict(exclude_unset=True)
 
         for field, value in update_data.items():
-            if field == 'legal_trading_name':
-                existing_client.legal_trading_name = value
-            elif field == 'workfin_reference':
-                existing_client.workfin_reference = value
-            elif field == 'contact_email':
-                existing_client.contact_email = value
-            elif field == 'contact_phone':
-                existing_client.contact_phone = value
-            elif field == 'client_type':
-                existing_client.client_type = value
-            elif field == 'company_registration_no':
-                existing_client.company_registration_no = value
-            elif field == 'xero_vat_tax_type':
-                existing_client.xero_vat_tax_type = value
-            elif field == 'expanded_logo_url':
-                existing_client.expanded_logo_url = value
-            elif field == 'logo_url':
-                existing_client.logo_url = value
-            elif field == 'accounting_system':
-                existing_client.accounting_system = value
-            elif field == 'xero_app':
-                existing_client.xero_app = value
-            elif field == 'license_workfin_users':
-                existing_client.license_workfin_users = value
-            elif field == 'license_compass_connections':
-                existing_client.license_compass_connections = value
-            elif field == 'license_finance_system_connections':
-                existing_client.license_finance_system_connections = value
-            elif field == 'license_pms_connections':
-                existing_client.license_pms_connections = value
-            elif field == 'license_purchasing_system_connections':
-                existing_client.license_purchasing_system_connections = value
-            elif field == 'accountant_name':
-                existing_client.accountant_name = value
-            elif field == 'accountant_address':
-                existing_client.accountant_address = value
-            elif field == 'accountant_contact_no':
-                existing_client.accountant_contact_no = value
-            elif field == 'accountant_email':
-                existing_client.accountant_email = value
-            elif field == 'it_provider_name':
-                existing_client.it_provider_name = value
-            elif field == 'it_provider_address':
-                existing_client.it_provider_address = value
-            elif field == 'it_provider_postcode':
-                existing_client.it_provider_postcode = value
-            elif field == 'it_provider_contact_name':
-                existing_client.it_provider_contact_name = value
-            elif field == 'it_provider_phone_1':
-                existing_client.it_provider_phone_1 = value
-            elif field == 'it_provider_phone_2':
-                existing_client.it_provider_phone_2 = value
-            elif field == 'it_provider_email':
-                existing_client.it_provider_email = value
-            elif field == 'it_provider_notes':
-                existing_client.it_provider_notes = value
-            elif field == 'feature_clinician_pay_enabled':
-                existing_client.feature_clinician_pay_enabled = value
-            elif field == 'feature_powerbi_enabled':
-                existing_client.feature_powerbi_enabled = value
+            if field in CLIENT_UPDATABLE_FIELDS:
+                setattr(existing_client, field, value)
+
+        # Nothing actually changed: skip the write and the follow-up refresh
+        if not db.is_modified(existing_client):
+            return existing_client
 
         await db.commit()
-        await db.refresh(existing_client)
+        # Only the server-side onupdate timestamp is stale; a full refresh would also expire
+        # the relationships loaded above and re-select every column
+        await db.refresh(existing_client, attribute_names=["updated_at"])
 
-        return ClientResponse.from_orm(existing_client)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid client ID format"
-        )
+        return existing_client
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -362,29 +287,28 @@ async def update_client(client_id: str, client: ClientUpdate, db: AsyncSession =
 
 
 @router.delete("/{client_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_client(client_id: str, db: AsyncSession = Depends(get_db)):
+async def delete_client(client_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Toggle client status between Active and Inactive (soft delete/restore)"""
     try:
+        # Toggle status: Active <-> Inactive in a single UPDATE (no read-modify-write)
         result = await db.execute(
-            select(Client).where(Client.id == uuid.UUID(client_id))
+            update(Client)
+            .where(Client.id == client_id)
+            .values(status=case(
+                (Client.status == "Active", literal("Inactive", Client.status.type)),
+                else_=literal("Active", Client.status.type)
+            ))
+            .returning(Client.id)
         )
-        client = result.scalar_one_or_none()
 
-        if not client:
+        if result.scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Client not found"
             )
 
-        # Toggle status: Active <-> Inactive
-        client.status = "Inactive" if client.status == "Active" else "Active"
         await db.commit()
         return None
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid client ID format"
-        )
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -394,24 +318,25 @@ async def delete_client(client_id: str, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{client_id}/users")
-async def get_client_users(client_id: str, db: AsyncSession = Depends(get_db)):
+async def get_client_users(client_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get all users for a specific client"""
     try:
         # Verify client exists
-        client_result = await db.execute(
-            select(Client).where(Client.id == uuid.UUID(client_id))
+        client_exists = await db.scalar(
+            select(exists().where(Client.id == client_id))
         )
-        if not client_result.scalar_one_or_none():
+        if not client_exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Client not found"
             )
 
-        # Get users for this client
+        # Get users for this client (only the columns the response needs)
         result = await db.execute(
-            select(User).where(User.client_id == uuid.UUID(client_id))
+            select(User.id, User.name, User.email, User.created_at)
+            .where(User.client_id == client_id)
         )
-        users = result.scalars().all()
+        users = result.all()
 
         return [
             {
@@ -425,11 +350,6 @@ async def get_client_users(client_id: str, db: AsyncSession = Depends(get_db)):
             }
             for user in users
         ]
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid client ID format"
-        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -438,14 +358,14 @@ async def get_client_users(client_id: str, db: AsyncSession = Depends(get_db)):
 
 
 @router.post("/{client_id}/users", status_code=status.HTTP_201_CREATED)
-async def create_client_user(client_id: str, user_data: dict, db: AsyncSession = Depends(get_db)):
+async def create_client_user(client_id: uuid.UUID, user_data: dict, db: AsyncSession = Depends(get_db)):
     """Create a new user for a client"""
     try:
         # Verify client exists
-        client_result = await db.execute(
-            select(Client).where(Client.id == uuid.UUID(client_id))
+        client_exists = await db.scalar(
+            select(exists().where(Client.id == client_id))
         )
-        if not client_result.scalar_one_or_none():
+        if not client_exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Client not found"
@@ -455,7 +375,7 @@ async def create_client_user(client_id: str, user_data: dict, db: AsyncSession =
         new_user = User(
             email=user_data.get("email"),
             name=user_data.get("name"),
-            client_id=uuid.UUID(client_id)
+            client_id=client_id
         )
         db.add(new_user)
         await db.commit()
@@ -469,11 +389,6 @@ async def create_client_user(client_id: str, user_data: dict, db: AsyncSession =
             "status": "Active",
             "created_at": new_user.created_at
         }
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid client ID format"
-        )
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -7,22 +7,23 @@ import uuid
 router = APIRouter()
 
 # Mock database
+_SEEDED_AT = datetime.now()
 MOCK_COA_CATEGORIES = {
     "1": {
         "id": "1",
         "coa_name": "Revenue",
         "category_number": "4000",
         "values": "Income from services",
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
+        "created_at": _SEEDED_AT,
+        "updated_at": _SEEDED_AT
     },
     "2": {
         "id": "2",
         "coa_name": "Expenses",
         "category_number": "5000",
         "values": "Operating expenses",
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
+        "created_at": _SEEDED_AT,
+        "updated_at": _SEEDED_AT
     }
 }
 
@@ -36,23 +37,25 @@ async def get_coa_categories():
 @router.get("/categories/{category_id}", response_model=CoACategoryResponse)
 async def get_coa_category(category_id: str):
     """Get a specific CoA category by ID"""
-    if category_id not in MOCK_COA_CATEGORIES:
+    category = MOCK_COA_CATEGORIES.get(category_id)
+    if category is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="CoA category not found"
         )
-    return MOCK_COA_CATEGORIES[category_id]
+    return category
 
 
 @router.post("/categories", response_model=CoACategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_coa_category(category: CoACategoryCreate):
     """Create a new CoA category"""
     new_id = str(uuid.uuid4())
+    now = datetime.now()
     new_category = {
         "id": new_id,
         **category.model_dump(),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
+        "created_at": now,
+        "updated_at": now
     }
     MOCK_COA_CATEGORIES[new_id] = new_category
     return new_category
@@ -61,14 +64,15 @@ async def create_coa_category(category: CoACategoryCreate):
 @router.put("/categories/{category_id}", response_model=CoACategoryResponse)
 async def update_coa_category(category_id: str, category: CoACategoryUpdate):
     """Update an existing CoA category"""
-    if category_id not in MOCK_COA_CATEGORIES:
+    existing_category = MOCK_COA_CATEGORIES.get(category_id)
+    if existing_category is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="CoA category not found"
         )
 
     updated_category = {
-        **MOCK_COA_CATEGORIES[category_id],
+        **existing_category,
         **category.model_dump(exclude_unset=True),
         "updated_at": datetime.now()
     }
@@ -79,10 +83,9 @@ async def update_coa_category(category_id: str, category: CoACategoryUpdate):
 @router.delete("/categories/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_coa_category(category_id: str):
     """Delete a CoA category"""
-    if category_id not in MOCK_COA_CATEGORIES:
+    if MOCK_COA_CATEGORIES.pop(category_id, None) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="CoA category not found"
         )
-    del MOCK_COA_CATEGORIES[category_id]
     return None
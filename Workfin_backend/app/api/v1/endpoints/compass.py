@@ -7,6 +7,7 @@ import uuid
 router = APIRouter()
 
 # Mock database
+_SEEDED_AT = datetime.now()
 MOCK_COMPASS_DATES = {
     "1": {
         "id": "1",
@@ -17,8 +18,8 @@ MOCK_COMPASS_DATES = {
         "pay_statement_available": date(2024, 1, 30),
         "pay_date": date(2024, 2, 5),
         "status": "Completed",
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
+        "created_at": _SEEDED_AT,
+        "updated_at": _SEEDED_AT
     }
 }
 
@@ -32,24 +33,26 @@ async def get_compass_dates():
 @router.get("/dates/{compass_id}", response_model=CompassDateResponse)
 async def get_compass_date(compass_id: str):
     """Get a specific compass date by ID"""
-    if compass_id not in MOCK_COMPASS_DATES:
+    compass_date = MOCK_COMPASS_DATES.get(compass_id)
+    if compass_date is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Compass date not found"
         )
-    return MOCK_COMPASS_DATES[compass_id]
+    return compass_date
 
 
 @router.post("/dates", response_model=CompassDateResponse, status_code=status.HTTP_201_CREATED)
 async def create_compass_date(compass_date: CompassDateCreate):
     """Create a new compass date"""
     new_id = str(uuid.uuid4())
+    now = datetime.now()
     new_compass_date = {
         "id": new_id,
         **compass_date.model_dump(),
         "status": "Active",
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
+        "created_at": now,
+        "updated_at": now
     }
     MOCK_COMPASS_DATES[new_id] = new_compass_date
     return new_compass_date
@@ -58,14 +61,15 @@ async def create_compass_date(compass_date: CompassDateCreate):
 @router.put("/dates/{compass_id}", response_model=CompassDateResponse)
 async def update_compass_date(compass_id: str, compass_date: CompassDateUpdate):
     """Update an existing compass date"""
-    if compass_id not in MOCK_COMPASS_DATES:
+    existing_compass_date = MOCK_COMPASS_DATES.get(compass_id)
+    if existing_compass_date is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Compass date not found"
         )
 
     updated_compass_date = {
-        **MOCK_COMPASS_DATES[compass_id],
+        **existing_compass_date,
         **compass_date.model_dump(exclude_unset=True),
         "updated_at": datetime.now()
     }
@@ -76,10 +80,9 @@ async def update_compass_date(compass_id: str, compass_date: CompassDateUpdate):
 @router.delete("/dates/{compass_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_compass_date(compass_id: str):
     """Delete a compass date"""
-    if compass_id not in MOCK_COMPASS_DATES:
+    if MOCK_COMPASS_DATES.pop(compass_id, None) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Compass date not found"
         )
-    del MOCK_COMPASS_DATES[compass_id]
     return None
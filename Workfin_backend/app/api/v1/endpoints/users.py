@@ -1,93 +1,138 @@
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from typing import List, Optional
+from pydantic import TypeAdapter, ValidationError
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from datetime import datetime
+import hashlib
 import uuid
 
 router = APIRouter()
 
-# Mock database
+# Mock database (pre-validated so responses skip per-request model construction)
+_SEEDED_AT = datetime.now()
 MOCK_USERS = {
-    "1": {
-        "id": "1",
-        "full_name": "Ajay Lad",
-        "email": "ajay.lad@workfin.com",
-        "role": "Admin",
-        "status": "Active",
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
-    },
-    "2": {
-        "id": "2",
-        "full_name": "John Doe",
-        "email": "john.doe@workfin.com",
-        "role": "User",
-        "status": "Active",
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
-    }
+    "1": UserResponse(
+        id="1",
+        full_name="Ajay Lad",
+        email="ajay.lad@workfin.com",
+        role="Admin",
+        status="Active",
+        created_at=_SEEDED_AT,
+        updated_at=_SEEDED_AT
+    ),
+    "2": UserResponse(
+        id="2",
+        full_name="John Doe",
+        email="john.doe@workfin.com",
+        role="User",
+        status="Active",
+        created_at=_SEEDED_AT,
+        updated_at=_SEEDED_AT
+    )
 }
 
+_USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
+# Serialized GET / body and its ETag, rebuilt lazily after any mutation
+_users_payload: Optional[bytes] = None
+_users_etag: Optional[str] = None
+
+
+def _invalidate_users_payload():
+    global _users_payload, _users_etag
+    _users_payload = None
+    _users_etag = None
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): '*', comma-separated lists and W/ prefixes"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 @router.get("/", response_model=List[UserResponse])
-async def get_users():
-    """Get all WorkFin users"""
-    return list(MOCK_USERS.values())
+async def get_users(request: Request):
+    """Get all WorkFin users (honours If-None-Match with a 304)"""
+    global _users_payload, _users_etag
+    if _users_payload is None:
+        _users_payload = _USER_LIST_ADAPTER.dump_json(list(MOCK_USERS.values()))
+        _users_etag = f'"{hashlib.blake2b(_users_payload, digest_size=16).hexdigest()}"'
+
+    headers = {"ETag": _users_etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), _users_etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=_users_payload, media_type="application/json", headers=headers)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(user_id: str):
     """Get a specific user by ID"""
-    if user_id not in MOCK_USERS:
+    user = MOCK_USERS.get(user_id)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    return MOCK_USERS[user_id]
+    return user
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(user: UserCreate):
     """Create a new WorkFin user"""
     new_id = str(uuid.uuid4())
-    new_user = {
-        "id": new_id,
-        "full_name": user.full_name,
-        "email": user.email,
-        "role": user.role,
-        "status": "Active",
-        "created_at": datetime.now(),
-        "updated_at": datetime.now()
-    }
+    now = datetime.now()
+    new_user = UserResponse(
+        id=new_id,
+        full_name=user.full_name,
+        email=user.email,
+        role=user.role,
+        status="Active",
+        created_at=now,
+        updated_at=now
+    )
     MOCK_USERS[new_id] = new_user
+    _invalidate_users_payload()
     return new_user
 
 
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(user_id: str, user: UserUpdate):
     """Update an existing user"""
-    if user_id not in MOCK_USERS:
+    existing_user = MOCK_USERS.get(user_id)
+    if existing_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
 
-    updated_user = {
-        **MOCK_USERS[user_id],
-        **user.model_dump(exclude_unset=True),
-        "updated_at": datetime.now()
-    }
+    # model_copy would skip validation, so rebuild the model and reject bad values (e.g. null full_name)
+    try:
+        updated_user = UserResponse.model_validate({
+            **existing_user.model_dump(),
+            **user.model_dump(exclude_unset=True),
+            "updated_at": datetime.now()
+        })
+    except ValidationError as e:
+        raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors()])
+
     MOCK_USERS[user_id] = updated_user
+    _invalidate_users_payload()
     return updated_user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: str):
     """Delete a user"""
-    if user_id not in MOCK_USERS:
+    if MOCK_USERS.pop(user_id, None) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    del MOCK_USERS[user_id]
+    _invalidate_users_payload()
     return None
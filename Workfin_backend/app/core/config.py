@@ -18,6 +18,15 @@ class Settings(BaseSettings):
 
     # Database Settings
     DATABASE_URL: str = ""
+    DB_ECHO: bool = False  # Log every SQL statement (development only)
+    DB_POOL_SIZE: int = 0  # 0 = NullPool (pgbouncer does the pooling); >0 = in-process pool
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a pooled connection before erroring
+    DB_POOL_RECYCLE: int = 1800  # Replace pooled connections older than this (seconds)
+    DB_POOL_PRE_PING: bool = True  # Check pooled connections are alive before handing them out
+    DB_CONNECT_TIMEOUT: int = 10  # asyncpg connect timeout (seconds)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100  # SQLAlchemy asyncpg dialect prepared statement LRU per connection (0 disables)
+    DB_DISABLE_JIT: bool = False  # Send jit=off at connect; only on direct connections (pgbouncer rejects it)
 
     @field_validator('CORS_ORIGINS', mode='before')
     @classmethod
@@ -2,16 +2,42 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
 from app.core.config import settings
+import asyncio
+import uuid
 
-# Create async engine with NullPool to work with pgbouncer
+server_settings = {"search_path": '"denpay-dev", public'}  # IMPORTANT: Set schema
+
+# Behind pgbouncer keep NullPool; set DB_POOL_SIZE to pool connections in-process instead
+if settings.DB_POOL_SIZE > 0:
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+else:
+    pool_options = {"poolclass": NullPool}
+
+# Short OLTP queries only pay JIT compile cost, never recoup it. Opt-in because pgbouncer
+# rejects startup parameters missing from its ignore_startup_parameters list
+if settings.DB_DISABLE_JIT:
+    server_settings["jit"] = "off"
+
+# Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=True,  # Set to False in production
+    echo=settings.DB_ECHO,
     future=True,
-    poolclass=NullPool,
     connect_args={
-        "server_settings": {"search_path": '"denpay-dev", public'}  # IMPORTANT: Set schema
-    }
+        "server_settings": server_settings,
+        "timeout": settings.DB_CONNECT_TIMEOUT,
+        # The dialect prepares statements itself, bypassing asyncpg's own statement_cache_size
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        # Unique names stop prepared statements colliding on pgbouncer-shared backends
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    },
+    **pool_options
 )
 
 # Create session maker
@@ -23,6 +49,24 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+
+async def warm_pool():
+    """Open DB_POOL_SIZE connections up front so early requests skip the connect handshake"""
+    if settings.DB_POOL_SIZE <= 0:
+        return
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.DB_POOL_SIZE)),
+        return_exceptions=True
+    )
+    # Hand every opened connection back to the pool before reporting any failure
+    for result in results:
+        if not isinstance(result, BaseException):
+            await result.close()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 # Base class for models
 Base = declarative_base()
 
@@ -1,28 +1,41 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import logging
 import os
 from dotenv import load_dotenv
 
 # Import routers
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.db.database import engine, warm_pool
 
 load_dotenv()
 
+# Log through uvicorn's logger so lifecycle messages follow its configured level and handlers
+logger = logging.getLogger("uvicorn.error")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("Starting DenPay Client Onboarding API...")
+    logger.info("Starting DenPay Client Onboarding API...")
+    try:
+        await warm_pool()
+    except Exception as e:
+        # Not fatal: requests will open connections on demand
+        logger.warning("Database pool warm-up failed: %s", e)
     yield
     # Shutdown
-    print("Shutting down DenPay Client Onboarding API...")
+    logger.info("Shutting down DenPay Client Onboarding API...")
+    await engine.dispose()
 
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -0,0 +1,34 @@
+-- Migration: Add indexes for user lookups
+-- Date: 2026-10-15
+-- Description: Indexes the foreign keys used to load a client's users and a user's roles.
+-- PostgreSQL does not index foreign key columns automatically, so these lookups were
+-- sequential scans. CONCURRENTLY avoids locking writes, so run this file outside a transaction.
+
+SET search_path TO "denpay-dev", public;
+
+-- =====================================================
+-- USERS
+-- =====================================================
+
+-- Used by GET /clients/{id}/users and the selectin load of Client.users
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_client_id
+    ON "denpay-dev".users(client_id);
+
+-- =====================================================
+-- USER ROLES
+-- =====================================================
+
+-- Used by the User.roles relationship
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_roles_user_id
+    ON "denpay-dev".user_roles(user_id);
+
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+
+-- Check new indexes created
+-- SELECT indexname, tablename
+-- FROM pg_indexes
+-- WHERE schemaname = 'denpay-dev'
+-- AND indexname IN ('idx_users_client_id', 'idx_user_roles_user_id')
+-- ORDER BY indexname;